@@ -3,27 +3,258 @@ Comprehensive blog utilities module for Quarto blog posts.
 
 This module provides a wide range of functions for creating formatted content
 including callouts, iframes, media embeds, data displays, and interactive elements.
+
+Builders render their markup through ``lru_cache``-wrapped ``_build_*_str``
+helpers, so repeated calls with the same arguments reuse the cached string.
+Public builders return ``LazyHTML`` objects, which only build that string
+when the result is displayed. Callout, alert, info box and quote content is
+rendered as Markdown when the optional ``markdown`` package is installed.
 """
 
-from IPython.display import IFrame, HTML, display, Markdown
-from typing import Optional, Union, List, Dict, Any
-import pandas as pd
-import json
-import base64
-from datetime import datetime
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union, List, Dict, Tuple, Sequence, Iterable, Callable
+from string import Formatter, Template
+from functools import lru_cache
+from io import StringIO
+from collections import ChainMap
+from copy import copy
+from numbers import Real
+from textwrap import dedent
+import warnings
+
+if TYPE_CHECKING:
+    # Only the table builders need NumPy and pandas, so they import them on first use
+    import markdown
+    import numpy as np
+    import pandas as pd
+
+
+# =============================================================================
+# TEMPLATE COMPILATION
+# =============================================================================
+
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;"
+})
+
+
+def _esc(value: object) -> str:
+    """Escape a value for use in HTML text or a double-quoted attribute."""
+    return str(value).translate(_HTML_ESCAPE)
+
+
+@lru_cache(maxsize=None)
+def _markdown_parser() -> Optional[markdown.Markdown]:
+    """Return a reusable ``markdown.Markdown`` instance, or None if it is not installed."""
+    try:
+        import markdown
+    except ImportError:
+        return None
+    return markdown.Markdown(extensions=["extra"])
+
+
+@lru_cache(maxsize=1024)
+def _render_markdown(content: str) -> str:
+    parser = _markdown_parser()
+    if parser is None:
+        return content
+    
+    html = parser.reset().convert(dedent(content))
+    if html.startswith("<p>") and html.endswith("</p>") and html.count("<p>") == 1:
+        return html[3:-4]
+    return html
+
+
+def _md(content: str) -> str:
+    """
+    Render Markdown ``content`` to HTML, once per distinct string.
+    
+    Content passes through unchanged when the optional ``markdown`` package
+    is missing, and so does content that is already HTML (a ``LazyHTML`` or
+    a string starting with a tag), so composed components are never turned
+    into code blocks. Indented triple-quoted text is dedented first, and a
+    lone paragraph is unwrapped so plain text keeps the inline layout the
+    templates were written for.
+    """
+    if not isinstance(content, str) or content.lstrip().startswith("<"):
+        return content
+    return _render_markdown(content)
+
+
+def _compile_renderer(
+    name: str,
+    args: str,
+    template: str,
+    loops: Optional[Dict[str, Tuple[str, List[str], str]]] = None
+) -> Callable[..., str]:
+    """
+    Compile a ``{field}`` template into a Python render function.
+    
+    The template is translated once into straight-line ``write`` calls on a
+    single ``StringIO`` buffer, so rendering never re-parses the markup or
+    builds intermediate per-item strings.
+    
+    Args:
+        name: Name of the generated function
+        args: Argument list of the generated function
+        template: Markup with ``{field}`` placeholders (``{field!s}`` calls str())
+        loops: Maps a placeholder to a ``(header, setup, body_template)`` triple;
+            the placeholder is replaced by a loop running ``setup`` statements and
+            emitting ``body_template`` on each iteration
+    
+    Returns:
+        The compiled render function returning the buffered markup
+    """
+    loops = loops or {}
+    lines = [f"def {name}({args}):", "    buf = StringIO()", "    w = buf.write"]
+    
+    def emit(tmpl: str, indent: str) -> None:
+        for literal, field, _, conversion in Formatter().parse(tmpl):
+            if literal:
+                lines.append(f"{indent}w({literal!r})")
+            if field is None:
+                continue
+            if field in loops:
+                header, setup, body = loops[field]
+                lines.append(f"{indent}{header}")
+                lines.extend(f"{indent}    {stmt}" for stmt in setup)
+                emit(body, indent + "    ")
+            elif conversion == "s":
+                lines.append(f"{indent}w(str({field}))")
+            else:
+                lines.append(f"{indent}w({field})")
+    
+    emit(template, "    ")
+    lines.append("    return buf.getvalue()")
+    
+    namespace: Dict[str, object] = {"StringIO": StringIO}
+    exec(compile("\n".join(lines), f"<blog_utils.{name}>", "exec"), namespace)
+    renderer: Callable[..., str] = namespace[name]  # type: ignore[assignment]
+    return renderer
+
+
+# =============================================================================
+# LAZY HTML
+# =============================================================================
+
+class LazyHTML:
+    """
+    HTML display object that builds its markup on first use.
+    
+    IPython only calls ``_repr_html_`` when the object is displayed, so the
+    markup of results that are discarded or never shown is never built. The
+    rendered string is cached, exposed as ``data`` like ``IPython.display.HTML``
+    and returned by ``str()`` for composing into larger HTML.
+    """
+    __slots__ = ("_render", "_html")
+    
+    def __init__(self, render: Callable[[], str]) -> None:
+        self._render = render
+        self._html: Optional[str] = None
+    
+    def _repr_html_(self) -> str:
+        if self._html is None:
+            self._html = self._render()
+        return self._html
+    
+    @property
+    def data(self) -> str:
+        return self._repr_html_()
+    
+    def __str__(self) -> str:
+        return self._repr_html_()
+
+
+def _cached(build: Callable[..., str], *args: object) -> Callable[..., str]:
+    """
+    Return the ``lru_cache``-wrapped ``build``, or its uncached function if ``args`` are unhashable.
+    
+    Checked when a public builder is called: an unhashable argument (say a
+    list passed as tab content) would otherwise only fail inside
+    ``_repr_html_``, where IPython swallows the error and shows the repr.
+    """
+    try:
+        hash(args)
+    except TypeError:
+        return build.__wrapped__  # type: ignore[attr-defined]
+    return build
+
+
+def _require_number(name: str, value: object) -> None:
+    if not isinstance(value, Real):
+        raise TypeError(f"{name} must be a number, got {type(value).__name__}")
 
 
 # =============================================================================
 # CALLOUTS & ALERTS
 # =============================================================================
 
+_CALLOUT_TYPES = ("note", "tip", "warning", "caution", "important")
+
+
+def _callout_class(callout_type: str, collapsible: bool, collapsed: bool) -> str:
+    collapse_class = "callout-collapse" if collapsible else ""
+    collapse_state = "collapsed" if collapsed and collapsible else ""
+    return f"callout-{callout_type} {collapse_class} {collapse_state}"
+
+
+# Class strings for every known callout type and collapse combination
+_CALLOUT_CLASS = {
+    (callout_type, collapsible, collapsed): _callout_class(callout_type, collapsible, collapsed)
+    for callout_type in _CALLOUT_TYPES
+    for collapsible in (False, True)
+    for collapsed in (False, True)
+}
+
+_CALLOUT_TMPL = Template("""
+    <div class="callout callout-style-default $callout_class">
+        <div class="callout-header d-flex align-content-center">
+            <div class="callout-icon-container">
+                <i class="callout-icon"></i>
+            </div>
+            <div class="callout-title-container flex-fill">
+                $title
+            </div>
+        </div>
+        <div class="callout-body-container callout-body">
+            $content
+        </div>
+    </div>
+    """)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_callout_str(
+    content: str,
+    callout_type: str,
+    title: Optional[str],
+    collapsible: bool,
+    collapsed: bool
+) -> str:
+    display_title = title or callout_type.title()
+    callout_class = (
+        _CALLOUT_CLASS.get((callout_type, bool(collapsible), bool(collapsed)))
+        or _callout_class(callout_type, collapsible, collapsed)
+    )
+    
+    return _CALLOUT_TMPL.substitute(
+        callout_class=callout_class,
+        title=display_title,
+        content=content
+    )
+
+
 def create_callout(
     content: str,
     callout_type: str = "note",
     title: Optional[str] = None,
     collapsible: bool = False,
     collapsed: bool = False
-) -> HTML:
+) -> LazyHTML:
     """
     Create a Quarto-style callout box.
     
@@ -35,29 +266,52 @@ def create_callout(
         collapsed: Start collapsed if collapsible (default: False)
     
     Returns:
-        IPython HTML object with Quarto callout
+        LazyHTML object with Quarto callout
     """
-    display_title = title or callout_type.title()
-    collapse_class = "callout-collapse" if collapsible else ""
-    collapse_state = "collapsed" if collapsed and collapsible else ""
+    build = _cached(_build_callout_str, content, callout_type, title, collapsible, collapsed)
     
-    callout_html = f"""
-    <div class="callout callout-style-default callout-{callout_type} {collapse_class} {collapse_state}">
-        <div class="callout-header d-flex align-content-center">
-            <div class="callout-icon-container">
-                <i class="callout-icon"></i>
-            </div>
-            <div class="callout-title-container flex-fill">
-                {display_title}
-            </div>
-        </div>
-        <div class="callout-body-container callout-body">
-            {content}
-        </div>
-    </div>
+    return LazyHTML(lambda: build(_md(content), callout_type, title, collapsible, collapsed))
+
+
+_ALERT_DISMISS_BUTTON = """
+    <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
     """
+
+_ALERT_TYPES = ("info", "success", "warning", "danger", "primary", "secondary")
+
+# Full class attribute for every alert type, with and without the close button
+_ALERT_CLASS = {
+    (alert_type, dismissible): f"alert alert-{alert_type}{' alert-dismissible' if dismissible else ''}"
+    for alert_type in _ALERT_TYPES
+    for dismissible in (False, True)
+}
+
+_ALERT_TMPL = Template("""
+    <div class="$alert_class" role="alert">
+        $title_html$content
+        $dismiss_button
+    </div>
+    """)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_alert_str(
+    content: str,
+    alert_type: str,
+    title: Optional[str],
+    dismissible: bool
+) -> str:
+    dismissible = bool(dismissible)
+    alert_class = _ALERT_CLASS.get((alert_type, dismissible)) or _ALERT_CLASS[("info", dismissible)]
+    title_html = f"<strong>{title}</strong><br>" if title else ""
+    dismiss_button = _ALERT_DISMISS_BUTTON if dismissible else ""
     
-    return HTML(callout_html)
+    return _ALERT_TMPL.substitute(
+        alert_class=alert_class,
+        title_html=title_html,
+        content=content,
+        dismiss_button=dismiss_button
+    )
 
 
 def create_alert_box(
@@ -65,43 +319,54 @@ def create_alert_box(
     alert_type: str = "info",
     title: Optional[str] = None,
     dismissible: bool = False
-) -> HTML:
+) -> LazyHTML:
     """
     Create a Bootstrap-style alert box.
     
     Args:
-        content: Alert content text
+        content: Alert content text (supports markdown)
         alert_type: "info", "success", "warning", "danger", "primary", "secondary" (default: "info")
         title: Optional title for the alert
         dismissible: Add close button (default: False)
     
     Returns:
-        IPython HTML object with styled alert
-    """
-    alert_classes = {
-        "info": "alert-info",
-        "success": "alert-success", 
-        "warning": "alert-warning",
-        "danger": "alert-danger",
-        "primary": "alert-primary",
-        "secondary": "alert-secondary"
-    }
-    
-    alert_class = alert_classes.get(alert_type, "alert-info")
-    title_html = f"<strong>{title}</strong><br>" if title else ""
-    dismiss_class = " alert-dismissible" if dismissible else ""
-    dismiss_button = """
-    <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
-    """ if dismissible else ""
-    
-    alert_html = f"""
-    <div class="alert {alert_class}{dismiss_class}" role="alert">
-        {title_html}{content}
-        {dismiss_button}
-    </div>
+        LazyHTML object with styled alert
     """
+    build = _cached(_build_alert_str, content, alert_type, title, dismissible)
     
-    return HTML(alert_html)
+    return LazyHTML(lambda: build(_md(content), alert_type, title, dismissible))
+
+
+_INFO_BOX_TMPL = Template("""
+    <div style="
+        background-color: $background_color;
+        border-left: 4px solid $border_color;
+        padding: 15px;
+        margin: 15px 0;
+        border-radius: 4px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    ">
+        <div style="display: flex; align-items: flex-start;">
+            <div style="font-size: 1.2em; margin-right: 10px;">$icon</div>
+            <div style="flex: 1;">$content</div>
+        </div>
+    </div>
+    """)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_info_box_str(
+    content: str,
+    icon: str,
+    background_color: str,
+    border_color: str
+) -> str:
+    return _INFO_BOX_TMPL.substitute(
+        background_color=background_color,
+        border_color=border_color,
+        icon=icon,
+        content=content
+    )
 
 
 def create_info_box(
@@ -109,42 +374,61 @@ def create_info_box(
     icon: str = "ℹ️",
     background_color: str = "#e3f2fd",
     border_color: str = "#2196f3"
-) -> HTML:
+) -> LazyHTML:
     """
     Create a custom styled info box.
     
     Args:
-        content: Box content
+        content: Box content (supports markdown)
         icon: Icon or emoji (default: "ℹ️")
         background_color: Background color (default: light blue)
         border_color: Border color (default: blue)
     
     Returns:
-        IPython HTML object with custom info box
-    """
-    box_html = f"""
-    <div style="
-        background-color: {background_color};
-        border-left: 4px solid {border_color};
-        padding: 15px;
-        margin: 15px 0;
-        border-radius: 4px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    ">
-        <div style="display: flex; align-items: flex-start;">
-            <div style="font-size: 1.2em; margin-right: 10px;">{icon}</div>
-            <div style="flex: 1;">{content}</div>
-        </div>
-    </div>
+        LazyHTML object with custom info box
     """
+    build = _cached(_build_info_box_str, content, icon, background_color, border_color)
     
-    return HTML(box_html)
+    return LazyHTML(lambda: build(_md(content), icon, background_color, border_color))
 
 
 # =============================================================================
 # IFRAMES & EMBEDS
 # =============================================================================
 
+_IFRAME_TMPL = Template("""
+    <div style="position: relative; width: $max_width; height: 0; padding-bottom: $padding_bottom; overflow: hidden; border-radius: 8px;">
+        <iframe src="$src" 
+                style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: $border;"
+                loading="$loading"
+                $allowfullscreen_attr>
+        </iframe>
+    </div>
+    """)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_iframe_str(
+    src: str,
+    aspect_ratio: float,
+    max_width: str,
+    border: str,
+    allowfullscreen: bool,
+    loading: str
+) -> str:
+    padding_bottom = f"{aspect_ratio * 100}%"
+    allowfullscreen_attr = "allowfullscreen" if allowfullscreen else ""
+    
+    return _IFRAME_TMPL.substitute(
+        max_width=max_width,
+        padding_bottom=padding_bottom,
+        src=src,
+        border=border,
+        loading=loading,
+        allowfullscreen_attr=allowfullscreen_attr
+    )
+
+
 def create_responsive_iframe(
     src: str,
     aspect_ratio: float = 0.5625,  # 16:9 default
@@ -152,7 +436,7 @@ def create_responsive_iframe(
     border: str = "0",
     allowfullscreen: bool = True,
     loading: str = "lazy"
-) -> HTML:
+) -> LazyHTML:
     """
     Create a responsive iframe that scales with container width.
     
@@ -165,22 +449,57 @@ def create_responsive_iframe(
         loading: Loading behavior - "lazy" or "eager" (default: "lazy")
     
     Returns:
-        IPython HTML object with responsive iframe
+        LazyHTML object with responsive iframe
     """
-    padding_bottom = f"{aspect_ratio * 100}%"
-    allowfullscreen_attr = "allowfullscreen" if allowfullscreen else ""
+    _require_number("aspect_ratio", aspect_ratio)
+    build = _cached(
+        _build_iframe_str, src, aspect_ratio, max_width, border, allowfullscreen, loading
+    )
     
-    iframe_html = f"""
-    <div style="position: relative; width: {max_width}; height: 0; padding-bottom: {padding_bottom}; overflow: hidden; border-radius: 8px;">
-        <iframe src="{src}" 
-                style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; border: {border};"
-                loading="{loading}"
-                {allowfullscreen_attr}>
-        </iframe>
-    </div>
-    """
+    return LazyHTML(lambda: build(src, aspect_ratio, max_width, border, allowfullscreen, loading))
+
+
+_YOUTUBE_EMBED_BASE = "https://www.youtube.com/embed/"
+_VIMEO_EMBED_BASE = "https://player.vimeo.com/video/"
+
+
+@lru_cache(maxsize=512, typed=True)
+def _youtube_url(
+    video_id: str,
+    start_time: Optional[int],
+    autoplay: bool,
+    controls: bool
+) -> str:
+    params = []
+    if start_time:
+        params.append(f"start={start_time}")
+    if autoplay:
+        params.append("autoplay=1")
+    if not controls:
+        params.append("controls=0")
+    
+    param_string = "&" + "&".join(params) if params else ""
     
-    return HTML(iframe_html)
+    return f"{_YOUTUBE_EMBED_BASE}{_esc(video_id)}?{param_string}"
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_youtube_str(
+    video_id: str,
+    width: str,
+    aspect_ratio: float,
+    start_time: Optional[int],
+    autoplay: bool,
+    controls: bool
+) -> str:
+    return _build_iframe_str(
+        _youtube_url(video_id, start_time, autoplay, controls),
+        aspect_ratio,
+        width,
+        "0",
+        True,
+        "lazy"
+    )
 
 
 def embed_youtube(
@@ -190,7 +509,7 @@ def embed_youtube(
     start_time: Optional[int] = None,
     autoplay: bool = False,
     controls: bool = True
-) -> HTML:
+) -> LazyHTML:
     """
     Embed a YouTube video responsively.
     
@@ -203,35 +522,50 @@ def embed_youtube(
         controls: Show video controls (default: True)
     
     Returns:
-        IPython HTML object with responsive YouTube embed
+        LazyHTML object with responsive YouTube embed
     """
-    params = []
-    if start_time:
-        params.append(f"start={start_time}")
-    if autoplay:
-        params.append("autoplay=1")
-    if not controls:
-        params.append("controls=0")
-    
-    param_string = "&" + "&".join(params) if params else ""
+    _require_number("aspect_ratio", aspect_ratio)
+    build = _cached(
+        _build_youtube_str, video_id, width, aspect_ratio, start_time, autoplay, controls
+    )
     
-    return create_responsive_iframe(
-        src=f"https://www.youtube.com/embed/{video_id}?{param_string}",
-        aspect_ratio=aspect_ratio,
-        max_width=width
+    return LazyHTML(lambda: build(video_id, width, aspect_ratio, start_time, autoplay, controls))
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_vimeo_str(video_id: str, width: str, aspect_ratio: float) -> str:
+    return _build_iframe_str(
+        f"{_VIMEO_EMBED_BASE}{_esc(video_id)}",
+        aspect_ratio,
+        width,
+        "0",
+        True,
+        "lazy"
     )
 
 
-def embed_vimeo(video_id: str, width: str = "100%", aspect_ratio: float = 0.5625) -> HTML:
+def embed_vimeo(video_id: str, width: str = "100%", aspect_ratio: float = 0.5625) -> LazyHTML:
     """Embed a Vimeo video responsively."""
-    return create_responsive_iframe(
-        src=f"https://player.vimeo.com/video/{video_id}",
-        aspect_ratio=aspect_ratio,
-        max_width=width
-    )
+    _require_number("aspect_ratio", aspect_ratio)
+    build = _cached(_build_vimeo_str, video_id, width, aspect_ratio)
+    
+    return LazyHTML(lambda: build(video_id, width, aspect_ratio))
+
+
+_TWEET_TMPL = """
+    <blockquote class="twitter-tweet" data-theme="%s">
+        <a href="%s"></a>
+    </blockquote>
+    <script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>
+    """
+
 
+@lru_cache(maxsize=512, typed=True)
+def _build_tweet_str(tweet_url: str, theme: str) -> str:
+    return _TWEET_TMPL % (theme, tweet_url)
 
-def embed_twitter_tweet(tweet_url: str, theme: str = "light") -> HTML:
+
+def embed_twitter_tweet(tweet_url: str, theme: str = "light") -> LazyHTML:
     """
     Embed a Twitter tweet.
     
@@ -240,19 +574,14 @@ def embed_twitter_tweet(tweet_url: str, theme: str = "light") -> HTML:
         theme: "light" or "dark" (default: "light")
     
     Returns:
-        IPython HTML object with Twitter embed
-    """
-    tweet_html = f"""
-    <blockquote class="twitter-tweet" data-theme="{theme}">
-        <a href="{tweet_url}"></a>
-    </blockquote>
-    <script async src="https://platform.twitter.com/widgets.js" charset="utf-8"></script>
+        LazyHTML object with Twitter embed
     """
+    build = _cached(_build_tweet_str, tweet_url, theme)
     
-    return HTML(tweet_html)
+    return LazyHTML(lambda: build(tweet_url, theme))
 
 
-def embed_codepen(pen_id: str, user: str, height: int = 400, theme: str = "default") -> HTML:
+def embed_codepen(pen_id: str, user: str, height: int = 400, theme: str = "default") -> LazyHTML:
     """
     Embed a CodePen.
     
@@ -263,7 +592,7 @@ def embed_codepen(pen_id: str, user: str, height: int = 400, theme: str = "defau
         theme: CodePen theme (default: "default")
     
     Returns:
-        IPython HTML object with CodePen embed
+        LazyHTML object with CodePen embed
     """
     return create_responsive_iframe(
         src=f"https://codepen.io/{user}/embed/{pen_id}?height={height}&theme-id={theme}&default-tab=result",
@@ -272,11 +601,26 @@ def embed_codepen(pen_id: str, user: str, height: int = 400, theme: str = "defau
     )
 
 
+_PLOTLY_TMPL = """
+    <iframe src="%s" 
+            width="%s" 
+            height="%s" 
+            frameborder="0" 
+            style="border: 0; border-radius: 8px;">
+    </iframe>
+    """
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_plotly_str(chart_url: str, height: int, width: str) -> str:
+    return _PLOTLY_TMPL % (chart_url, width, height)
+
+
 def embed_plotly_chart(
     chart_url: str,
     height: int = 500,
     width: str = "100%"
-) -> HTML:
+) -> LazyHTML:
     """
     Embed a Plotly chart from a sharing URL.
     
@@ -286,22 +630,237 @@ def embed_plotly_chart(
         width: Width (default: "100%")
     
     Returns:
-        IPython HTML object with Plotly embed
-    """
-    iframe_html = f"""
-    <iframe src="{chart_url}" 
-            width="{width}" 
-            height="{height}" 
-            frameborder="0" 
-            style="border: 0; border-radius: 8px;">
-    </iframe>
+        LazyHTML object with Plotly embed
     """
+    build = _cached(_build_plotly_str, chart_url, height, width)
     
-    return HTML(iframe_html)
+    return LazyHTML(lambda: build(chart_url, height, width))
 # =============================================================================
 # DATA DISPLAY & TABLES
 # =============================================================================
 
+def _format_numeric_column(values: np.ndarray, precision: int) -> Optional[List[str]]:
+    """
+    Format a numeric column the way ``DataFrame.to_html`` does, one NumPy pass per column.
+    
+    Returns None when pandas would switch to scientific notation, so the
+    caller can fall back to pandas for those columns.
+    """
+    import numpy as np
+    
+    if values.dtype.kind in "iu":
+        return values.astype(str).tolist()
+    
+    finite = np.isfinite(values)
+    abs_vals = np.abs(values[finite])
+    if (abs_vals > 1e6).any() or ((abs_vals > 0) & (abs_vals < 10.0 ** -precision)).any():
+        return None
+    
+    text = np.where(np.isnan(values), "NaN", np.char.mod(f"%.{precision}f", values))
+    if not finite.any():
+        return text.tolist()
+    
+    # Trim the zeros every finite value shares, keeping one digit after the point
+    numbers = text[finite]
+    trailing = np.char.str_len(numbers) - np.char.str_len(np.char.rstrip(numbers, "0"))
+    trim = min(int(trailing.min()), precision - 1)
+    if not trim:
+        return text.tolist()
+    
+    return [t[:-trim] if ok else t for t, ok in zip(text.tolist(), finite.tolist())]
+
+
+# The characters DataFrame.to_html(escape=True) replaces; quotes are left as-is
+_TO_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;"
+})
+
+
+def _numeric_table_html(
+    index: Sequence[object],
+    labels: Sequence[object],
+    arrays: Sequence[np.ndarray],
+    classes: str,
+    table_id: Optional[str],
+    escape: bool = False
+) -> Optional[str]:
+    """
+    Write ``DataFrame.to_html`` markup for numeric column arrays.
+    
+    With ``escape`` the index and column labels are escaped the way
+    ``to_html``'s default ``escape=True`` does. Returns None when custom
+    pandas display options or scientific notation would change the
+    formatting, so the caller can fall back to pandas.
+    """
+    import pandas as pd
+    
+    if pd.get_option("display.float_format") or pd.get_option("display.chop_threshold") is not None:
+        return None
+    
+    precision = pd.get_option("display.precision")
+    if precision < 1:
+        return None
+    
+    columns = []
+    for values in arrays:
+        formatted = _format_numeric_column(values, precision)
+        if formatted is None:
+            return None
+        columns.append(formatted)
+    
+    if escape:
+        index = [str(label).translate(_TO_HTML_ESCAPE) for label in index]
+        labels = [str(label).translate(_TO_HTML_ESCAPE) for label in labels]
+    
+    buf = StringIO()
+    w = buf.write
+    border = pd.get_option("display.html.border")
+    id_attr = f' id="{table_id}"' if table_id else ""
+    w(f'<table border="{border}" class="dataframe {classes}"{id_attr}>\n')
+    w('  <thead>\n    <tr style="text-align: right;">\n      <th></th>\n')
+    for label in labels:
+        w(f"      <th>{label}</th>\n")
+    w("    </tr>\n  </thead>\n  <tbody>\n")
+    for label, row in zip(index, zip(*columns)):
+        w(f"    <tr>\n      <th>{label}</th>\n      <td>")
+        w("</td>\n      <td>".join(row))
+        w("</td>\n    </tr>\n")
+    w("  </tbody>\n</table>")
+    
+    return buf.getvalue()
+
+
+def _fast_to_html(df: pd.DataFrame, classes: str, table_id: str) -> Optional[str]:
+    """
+    Render a plain numeric DataFrame straight from its NumPy columns.
+    
+    Produces the same markup as ``df.to_html(classes=..., escape=False,
+    table_id=...)`` without pandas' per-cell Python formatting. Returns None
+    for anything outside the simple case (non-numeric or empty frames, named
+    or hierarchical axes, missing index labels, nullable extension dtypes,
+    custom display options) so the caller can use pandas.
+    """
+    import numpy as np
+    
+    if df.empty or df.index.nlevels > 1 or df.columns.nlevels > 1:
+        return None
+    if df.index.name is not None or df.columns.name is not None:
+        return None
+    if not isinstance(df.index.dtype, np.dtype) or df.index.dtype.kind not in "iuO":
+        return None
+    # pandas prints a missing label as NaN, which str() does not reproduce
+    if df.index.hasnans:
+        return None
+    # Extension dtypes (Int64, Float64) print missing values as <NA>, not NaN
+    if any(not isinstance(dtype, np.dtype) or dtype.kind not in "iuf" for dtype in df.dtypes):
+        return None
+    
+    arrays = [col.to_numpy() for _, col in df.items()]
+    return _numeric_table_html(df.index, df.columns, arrays, classes, table_id)
+
+
+_SUMMARY_STATS_INDEX = ("count", "mean", "std", "min", "25%", "50%", "75%", "max")
+
+
+def _summary_stats(numeric: pd.DataFrame) -> Optional[np.ndarray]:
+    """
+    Compute ``numeric.describe().round(3)`` as an (8, n_columns) array.
+    
+    All eight statistics come from a handful of NaN-aware passes over one
+    float64 block, skipping describe()'s per-column Series machinery. Returns
+    None for frames describe() would treat differently (non-numeric, empty,
+    named or hierarchical columns).
+    """
+    import numpy as np
+    
+    if numeric.empty or numeric.columns.nlevels > 1 or numeric.columns.name is not None:
+        return None
+    if any(
+        not isinstance(dtype, np.dtype) or (dtype.kind not in "iu" and dtype != np.float64)
+        for dtype in numeric.dtypes
+    ):
+        return None
+    
+    arr = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    with warnings.catch_warnings():
+        # All-NaN and single-value columns yield NaN statistics, as in describe()
+        warnings.simplefilter("ignore", RuntimeWarning)
+        stats = np.vstack([
+            np.count_nonzero(~np.isnan(arr), axis=0),
+            np.nanmean(arr, axis=0),
+            np.nanstd(arr, axis=0, ddof=1),
+            np.nanmin(arr, axis=0),
+            np.nanpercentile(arr, [25, 50, 75], axis=0),
+            np.nanmax(arr, axis=0),
+        ]).round(3)
+    
+    return stats
+
+
+def _snapshot(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a frame that later edits to ``df`` cannot change.
+    
+    Under copy-on-write (always on from pandas 3.0) a shallow copy already is
+    one, so the values are only copied on older pandas.
+    """
+    import pandas as pd
+    
+    if int(pd.__version__.split(".", 1)[0]) >= 3 or pd.get_option("mode.copy_on_write") is True:
+        return df.copy(deep=False)
+    return df.copy()
+
+
+# Table class attribute for each (striped, hover) combination
+_TABLE_CLASS = {
+    (striped, hover): "table" + (" table-striped" if striped else "") + (" table-hover" if hover else "")
+    for striped in (False, True)
+    for hover in (False, True)
+}
+
+
+def _wrap_styled_table(
+    table_html: str,
+    title: Optional[str],
+    caption: Optional[str],
+    responsive: bool
+) -> str:
+    title_html = f"<h4>{title}</h4>" if title else ""
+    caption_html = f"<caption>{caption}</caption>" if caption else ""
+    
+    if responsive:
+        table_html = f'<div class="table-responsive">{table_html}</div>'
+    
+    return f"""
+    <div style="margin: 20px 0;">
+        {title_html}
+        {table_html}
+        {caption_html}
+    </div>
+    """
+
+
+def _build_styled_table_str(
+    df: pd.DataFrame,
+    title: Optional[str],
+    caption: Optional[str],
+    max_rows: Optional[int],
+    striped: bool,
+    hover: bool,
+    responsive: bool
+) -> str:
+    display_df = df.head(max_rows) if max_rows else df
+    table_class_str = _TABLE_CLASS[(bool(striped), bool(hover))]
+    
+    table_html = _fast_to_html(display_df, table_class_str, "styled-table")
+    if table_html is None:
+        table_html = display_df.to_html(classes=table_class_str, escape=False, table_id="styled-table")
+    
+    return _wrap_styled_table(table_html, title, caption, responsive)
+
+
 def create_styled_table(
     df: pd.DataFrame,
     title: Optional[str] = None,
@@ -310,7 +869,7 @@ def create_styled_table(
     striped: bool = True,
     hover: bool = True,
     responsive: bool = True
-) -> HTML:
+) -> LazyHTML:
     """
     Create a styled HTML table from a pandas DataFrame.
     
@@ -324,42 +883,36 @@ def create_styled_table(
         responsive: Responsive table (default: True)
     
     Returns:
-        IPython HTML object with styled table
+        LazyHTML object with styled table
     """
-    display_df = df.head(max_rows) if max_rows else df
-    
-    table_classes = ["table"]
-    if striped:
-        table_classes.append("table-striped")
-    if hover:
-        table_classes.append("table-hover")
+    # Snapshot the rows now so later edits to df do not change the rendered table
+    display_df = _snapshot(df.head(max_rows) if max_rows else df)
     
-    table_class_str = " ".join(table_classes)
-    
-    title_html = f"<h4>{title}</h4>" if title else ""
-    caption_html = f"<caption>{caption}</caption>" if caption else ""
-    
-    table_html = display_df.to_html(classes=table_class_str, escape=False, table_id="styled-table")
+    return LazyHTML(lambda: _build_styled_table_str(display_df, title, caption, None, striped, hover, responsive))
+
+
+def _build_summary_stats_str(numeric: pd.DataFrame, title: str) -> str:
+    import pandas as pd
     
-    if responsive:
-        table_html = f'<div class="table-responsive">{table_html}</div>'
+    stats = _summary_stats(numeric)
+    if stats is None:
+        return _build_styled_table_str(numeric.describe().round(3), title, None, None, True, True, True)
     
-    final_html = f"""
-    <div style="margin: 20px 0;">
-        {title_html}
-        {table_html}
-        {caption_html}
-    </div>
-    """
+    classes = _TABLE_CLASS[(True, True)]
+    table_html = _numeric_table_html(_SUMMARY_STATS_INDEX, numeric.columns, list(stats.T), classes, "styled-table")
+    if table_html is None:
+        # Values needing pandas' formatting (e.g. counts above 1e6) still reuse the computed stats
+        described = pd.DataFrame(stats, index=list(_SUMMARY_STATS_INDEX), columns=numeric.columns)
+        table_html = described.to_html(classes=classes, escape=False, table_id="styled-table")
     
-    return HTML(final_html)
+    return _wrap_styled_table(table_html, title, None, True)
 
 
 def create_summary_stats(
     df: pd.DataFrame,
     columns: Optional[List[str]] = None,
     title: str = "Summary Statistics"
-) -> HTML:
+) -> LazyHTML:
     """
     Create a formatted summary statistics table.
     
@@ -369,44 +922,110 @@ def create_summary_stats(
         title: Table title (default: "Summary Statistics")
     
     Returns:
-        IPython HTML object with summary stats table
+        LazyHTML object with summary stats table
     """
-    if columns:
-        summary_df = df[columns].describe()
-    else:
-        summary_df = df.select_dtypes(include=['number']).describe()
+    # Selecting now raises for unknown columns here rather than at display time
+    numeric = _snapshot(df[columns] if columns else df.select_dtypes(include=['number']))
+    if numeric.columns.empty:
+        raise ValueError("Cannot describe a DataFrame without columns")
     
-    return create_styled_table(
-        summary_df.round(3),
-        title=title,
-        striped=True,
-        hover=True
-    )
+    return LazyHTML(lambda: _build_summary_stats_str(numeric, title))
 
 
-def create_comparison_table(
-    data: Dict[str, List],
-    title: str = "Comparison",
-    highlight_best: bool = True
-) -> HTML:
+def _aligned_columns(data: Dict[str, Sequence[Union[int, float, str]]]) -> Optional[List[np.ndarray]]:
     """
-    Create a comparison table with optional highlighting.
+    Return ``data``'s columns as 1-D arrays, or None unless they are non-empty and equal length.
     
-    Args:
-        data: Dictionary with column names as keys and lists as values
-        title: Table title
-        highlight_best: Highlight best values (default: True)
+    Also None when NumPy coerced a mixed column such as ``[90, "n/a"]`` to
+    strings, so those keep pandas' handling instead of comparing as text.
+    """
+    import numpy as np
     
-    Returns:
-        IPython HTML object with comparison table
+    if not data:
+        return None
+    
+    arrays = [np.asarray(values) for values in data.values()]
+    n_rows = len(arrays[0])
+    if not n_rows or any(a.ndim != 1 or len(a) != n_rows for a in arrays):
+        return None
+    for a, values in zip(arrays, data.values()):
+        if a.dtype.kind == "U" and not all(isinstance(value, str) for value in values):
+            return None
+    
+    return arrays
+
+
+def _highlighted_table_html(
+    labels: Sequence[str],
+    arrays: List[np.ndarray]
+) -> Optional[str]:
     """
-    df = pd.DataFrame(data)
+    Render columns as a table with each column's maximum highlighted.
+    
+    Writes the rows directly instead of spinning up the pandas Styler
+    pipeline; numeric maxima come from NumPy, string maxima from ``max``.
+    Returns None for column types the Styler would handle differently so
+    the caller can fall back to it.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    n_rows = len(arrays[0])
+    precision = pd.get_option("styler.format.precision")
+    columns = []
+    for a in arrays:
+        if a.dtype.kind in "iuf":
+            text = np.char.mod(f"%.{precision}f", a) if a.dtype.kind == "f" else a.astype(str)
+            if np.isnan(a).all():
+                best = np.zeros(n_rows, dtype=bool)
+            else:
+                best = a == np.nanmax(a)
+        elif a.dtype.kind == "U":
+            text = a
+            best = a == max(a.tolist())
+        else:
+            return None
+        opening = np.where(best, '      <td style="background-color: lightgreen;">', "      <td>")
+        columns.append(np.char.add(np.char.add(opening, text), "</td>\n").tolist())
+    
+    buf = StringIO()
+    w = buf.write
+    w("<table>\n  <thead>\n    <tr>\n      <th>&nbsp;</th>\n")
+    for label in labels:
+        w(f"      <th>{label}</th>\n")
+    w("    </tr>\n  </thead>\n  <tbody>\n")
+    for i, row in enumerate(zip(*columns)):
+        w(f"    <tr>\n      <th>{i}</th>\n")
+        w("".join(row))
+        w("    </tr>\n")
+    w("  </tbody>\n</table>\n")
+    
+    return buf.getvalue()
+
+
+def _build_comparison_table_str(
+    data: Dict[str, Sequence[Union[int, float, str]]],
+    title: str,
+    highlight_best: bool
+) -> str:
+    import pandas as pd
+    
+    # Aligned columns are written directly; pandas only handles the rest
+    arrays = _aligned_columns(data)
+    styled_html = None
     
     if highlight_best:
         # Simple highlighting for numeric columns
-        styled_html = df.style.highlight_max(axis=0, color='lightgreen').to_html()
+        if arrays is not None:
+            styled_html = _highlighted_table_html(list(data), arrays)
+        if styled_html is None:
+            styled_html = pd.DataFrame(data).style.highlight_max(axis=0, color='lightgreen').to_html()
     else:
-        styled_html = df.to_html(classes="table table-striped table-hover")
+        classes = "table table-striped table-hover"
+        if arrays is not None and all(a.dtype.kind in "iuf" for a in arrays):
+            styled_html = _numeric_table_html(range(len(arrays[0])), list(data), arrays, classes, None, escape=True)
+        if styled_html is None:
+            styled_html = pd.DataFrame(data).to_html(classes=classes)
     
     final_html = f"""
     <div style="margin: 20px 0;">
@@ -417,34 +1036,62 @@ def create_comparison_table(
     </div>
     """
     
-    return HTML(final_html)
+    return final_html
 
-# =============================================================================
-# INTERACTIVE ELEMENTS
-# =============================================================================
 
-def create_tabs(
-    tabs_content: Dict[str, str],
-    tab_id: str = "custom-tabs"
-) -> HTML:
+def create_comparison_table(
+    data: Dict[str, Sequence[Union[int, float, str]]],
+    title: str = "Comparison",
+    highlight_best: bool = True
+) -> LazyHTML:
     """
-    Create Bootstrap-style tabs.
+    Create a comparison table with optional highlighting.
     
     Args:
-        tabs_content: Dictionary with tab names as keys and content as values
-        tab_id: Unique ID for the tab group (default: "custom-tabs")
+        data: Dictionary with column names as keys and lists as values
+        title: Table title
+        highlight_best: Highlight best values (default: True)
     
     Returns:
-        IPython HTML object with tabs
+        LazyHTML object with comparison table
     """
-    tab_nav = []
-    tab_content = []
+    columns = {key: copy(values) for key, values in data.items()}
     
-    for i, (tab_name, content) in enumerate(tabs_content.items()):
-        active_class = "active" if i == 0 else ""
-        tab_id_clean = tab_name.lower().replace(" ", "-")
-        
-        tab_nav.append(f'''
+    # Ragged or mixed columns go through pandas, which may reject them, so
+    # render those now for the error to surface here rather than at display
+    arrays = _aligned_columns(columns)
+    fast_kinds = "iufU" if highlight_best else "iuf"
+    if arrays is None or any(a.dtype.kind not in fast_kinds for a in arrays):
+        html = _build_comparison_table_str(columns, title, highlight_best)
+        return LazyHTML(lambda: html)
+    
+    return LazyHTML(lambda: _build_comparison_table_str(columns, title, highlight_best))
+
+# =============================================================================
+# INTERACTIVE ELEMENTS
+# =============================================================================
+
+_render_tabs = _compile_renderer(
+    "_render_tabs",
+    "tab_items, tab_id",
+    '''
+    <div>
+        <ul class="nav nav-tabs" id="{tab_id}" role="tablist">
+            {tab_nav}
+        </ul>
+        <div class="tab-content" id="{tab_id}-content">
+            {tab_content}
+        </div>
+    </div>
+    ''',
+    {
+        "tab_nav": (
+            "for i, (tab_name, _) in enumerate(tab_items):",
+            [
+                "active_class = 'active' if i == 0 else ''",
+                "tab_id_clean = tab_name.lower().replace(' ', '-')",
+            ],
+            '''
         <li class="nav-item" role="presentation">
             <button class="nav-link {active_class}" id="{tab_id}-{tab_id_clean}-tab" 
                     data-bs-toggle="tab" data-bs-target="#{tab_id}-{tab_id_clean}" 
@@ -452,81 +1099,179 @@ def create_tabs(
                 {tab_name}
             </button>
         </li>
-        ''')
-        
-        tab_content.append(f'''
-        <div class="tab-pane fade {'show active' if i == 0 else ''}" 
+        '''
+        ),
+        "tab_content": (
+            "for i, (tab_name, content) in enumerate(tab_items):",
+            [
+                "show_class = 'show active' if i == 0 else ''",
+                "tab_id_clean = tab_name.lower().replace(' ', '-')",
+            ],
+            '''
+        <div class="tab-pane fade {show_class}" 
              id="{tab_id}-{tab_id_clean}" role="tabpanel">
-            {content}
+            {content!s}
         </div>
-        ''')
-    
-    tabs_html = f'''
-    <div>
-        <ul class="nav nav-tabs" id="{tab_id}" role="tablist">
-            {"".join(tab_nav)}
-        </ul>
-        <div class="tab-content" id="{tab_id}-content">
-            {"".join(tab_content)}
-        </div>
-    </div>
-    '''
-    
-    return HTML(tabs_html)
+        '''
+        ),
+    }
+)
 
 
-def create_accordion(
-    accordion_items: Dict[str, str],
-    accordion_id: str = "custom-accordion",
-    allow_multiple: bool = False
-) -> HTML:
+@lru_cache(maxsize=512, typed=True)
+def _build_tabs_str(tab_items: Tuple[Tuple[str, str], ...], tab_id: str) -> str:
+    return _render_tabs(tab_items, tab_id)
+
+
+def create_tabs(
+    tabs_content: Dict[str, str],
+    tab_id: str = "custom-tabs"
+) -> LazyHTML:
     """
-    Create Bootstrap-style accordion.
+    Create Bootstrap-style tabs.
     
     Args:
-        accordion_items: Dictionary with section titles as keys and content as values
-        accordion_id: Unique ID for the accordion (default: "custom-accordion")
-        allow_multiple: Allow multiple sections open (default: False)
+        tabs_content: Dictionary with tab names as keys and content as values
+        tab_id: Unique ID for the tab group (default: "custom-tabs")
     
     Returns:
-        IPython HTML object with accordion
+        LazyHTML object with tabs
     """
-    accordion_sections = []
+    tab_items = tuple(tabs_content.items())
+    
+    build = _cached(_build_tabs_str, tab_items, tab_id)
     
-    for i, (title, content) in enumerate(accordion_items.items()):
-        section_id = f"{accordion_id}-section-{i}"
-        show_class = "show" if i == 0 else ""
-        collapsed_class = "" if i == 0 else "collapsed"
-        
-        accordion_sections.append(f'''
+    return LazyHTML(lambda: build(tab_items, tab_id))
+
+
+_render_accordion = _compile_renderer(
+    "_render_accordion",
+    "accordion_items, accordion_id, parent_id",
+    '''
+    <div class="accordion" id="{accordion_id}">
+        {sections}
+    </div>
+    ''',
+    {
+        "sections": (
+            "for i, (title, content) in enumerate(accordion_items):",
+            [
+                "section_id = f'{accordion_id}-section-{i}'",
+                "show_class = 'show' if i == 0 else ''",
+                "collapsed_class = '' if i == 0 else 'collapsed'",
+                "expanded = 'true' if i == 0 else 'false'",
+            ],
+            '''
         <div class="accordion-item">
             <h2 class="accordion-header" id="{section_id}-heading">
                 <button class="accordion-button {collapsed_class}" type="button" 
                         data-bs-toggle="collapse" data-bs-target="#{section_id}" 
-                        aria-expanded="{'true' if i == 0 else 'false'}">
-                    {title}
+                        aria-expanded="{expanded}">
+                    {title!s}
                 </button>
             </h2>
             <div id="{section_id}" class="accordion-collapse collapse {show_class}" 
-                 data-bs-parent="#{accordion_id if not allow_multiple else ''}">
+                 data-bs-parent="#{parent_id}">
                 <div class="accordion-body">
-                    {content}
+                    {content!s}
                 </div>
             </div>
         </div>
-        ''')
+        '''
+        ),
+    }
+)
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_accordion_str(
+    accordion_items: Tuple[Tuple[str, str], ...],
+    accordion_id: str,
+    allow_multiple: bool
+) -> str:
+    parent_id = accordion_id if not allow_multiple else ""
+    
+    return _render_accordion(accordion_items, accordion_id, parent_id)
+
+
+def create_accordion(
+    accordion_items: Dict[str, str],
+    accordion_id: str = "custom-accordion",
+    allow_multiple: bool = False
+) -> LazyHTML:
+    """
+    Create Bootstrap-style accordion.
     
-    accordion_html = f'''
-    <div class="accordion" id="{accordion_id}">
-        {"".join(accordion_sections)}
-    </div>
-    '''
+    Args:
+        accordion_items: Dictionary with section titles as keys and content as values
+        accordion_id: Unique ID for the accordion (default: "custom-accordion")
+        allow_multiple: Allow multiple sections open (default: False)
+    
+    Returns:
+        LazyHTML object with accordion
+    """
+    items = tuple(accordion_items.items())
     
-    return HTML(accordion_html)
+    build = _cached(_build_accordion_str, items, accordion_id, allow_multiple)
+    
+    return LazyHTML(lambda: build(items, accordion_id, allow_multiple))
 # =============================================================================
 # PROGRESS & METRICS
 # =============================================================================
 
+_PROGRESS_COLORS = ("primary", "secondary", "success", "info", "warning", "danger")
+
+
+def _progress_class(color: str, striped: bool, animated: bool) -> str:
+    return (
+        f"bg-{color}"
+        + (" progress-bar-striped" if striped else "")
+        + (" progress-bar-animated" if animated else "")
+    )
+
+
+# Class strings for every Bootstrap color and stripe/animation combination
+_PROGRESS_CLASS = {
+    (color, striped, animated): _progress_class(color, striped, animated)
+    for color in _PROGRESS_COLORS
+    for striped in (False, True)
+    for animated in (False, True)
+}
+
+# Filled with (progress_class, percentage, value, max_value, label_text)
+_PROGRESS_TMPL = '''
+    <div class="progress" style="height: 25px; margin: 10px 0;">
+        <div class="progress-bar %s" role="progressbar" 
+             style="width: %s%%" aria-valuenow="%s" 
+             aria-valuemin="0" aria-valuemax="%s">
+            %s
+        </div>
+    </div>
+    '''
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_progress_bar_str(
+    value: float,
+    max_value: float,
+    label: Optional[str],
+    color: str,
+    striped: bool,
+    animated: bool
+) -> str:
+    # Keep (value / max_value) * 100: reordering changes the last digit of the printed width
+    percentage = (value / max_value) * 100
+    
+    progress_class_str = (
+        _PROGRESS_CLASS.get((color, bool(striped), bool(animated)))
+        or _progress_class(color, striped, animated)
+    )
+    # Only format the default label when the caller did not supply one
+    label_text = label if label else "%.1f%%" % percentage
+    
+    return _PROGRESS_TMPL % (progress_class_str, percentage, value, max_value, label_text)
+
+
 def create_progress_bar(
     value: float,
     max_value: float = 100,
@@ -534,43 +1279,84 @@ def create_progress_bar(
     color: str = "primary",
     striped: bool = False,
     animated: bool = False
-) -> HTML:
+) -> LazyHTML:
     """
     Create a progress bar.
     
     Args:
         value: Current value
-        max_value: Maximum value (default: 100)
+        max_value: Maximum value, must be non-zero (default: 100)
         label: Optional label text
         color: Bootstrap color - "primary", "success", "info", "warning", "danger" (default: "primary")
         striped: Striped appearance (default: False)
         animated: Animated stripes (default: False)
     
     Returns:
-        IPython HTML object with progress bar
+        LazyHTML object with progress bar
     """
-    percentage = (value / max_value) * 100
-    
-    progress_classes = [f"bg-{color}"]
-    if striped:
-        progress_classes.append("progress-bar-striped")
-    if animated:
-        progress_classes.append("progress-bar-animated")
+    _require_number("value", value)
+    _require_number("max_value", max_value)
+    if max_value == 0:
+        raise ValueError("max_value must be non-zero")
     
-    progress_class_str = " ".join(progress_classes)
-    label_text = label or f"{percentage:.1f}%"
+    build = _cached(_build_progress_bar_str, value, max_value, label, color, striped, animated)
     
-    progress_html = f'''
-    <div class="progress" style="height: 25px; margin: 10px 0;">
-        <div class="progress-bar {progress_class_str}" role="progressbar" 
-             style="width: {percentage}%" aria-valuenow="{value}" 
-             aria-valuemin="0" aria-valuemax="{max_value}">
-            {label_text}
-        </div>
+    return LazyHTML(lambda: build(value, max_value, label, color, striped, animated))
+
+
+_CHANGE_COLORS = {
+    "positive": "#28a745",
+    "negative": "#dc3545",
+    "neutral": "#6c757d"
+}
+
+# Opening tag of the change indicator for each change type
+_CHANGE_HTML_OPEN = {
+    change_type: f'<div style="color: {color}; font-weight: bold; margin-top: 5px;">'
+    for change_type, color in _CHANGE_COLORS.items()
+}
+
+_METRIC_CARD_TMPL = Template('''
+    <div style="
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        padding: 20px;
+        margin: 10px 0;
+        text-align: center;
+        background: white;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    ">
+        $icon_html
+        <div style="font-size: 0.9em; color: #6c757d; margin-bottom: 5px;">$title</div>
+        <div style="font-size: 2em; font-weight: bold; color: #212529;">$value</div>
+        $subtitle_html
+        $change_html
     </div>
-    '''
+    ''')
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_metric_card_str(
+    title: str,
+    value: Union[str, int, float],
+    subtitle: Optional[str],
+    change: Optional[str],
+    change_type: str,
+    icon: Optional[str]
+) -> str:
+    change_open = _CHANGE_HTML_OPEN.get(change_type) or _CHANGE_HTML_OPEN["neutral"]
     
-    return HTML(progress_html)
+    icon_html = f'<div style="font-size: 2em; margin-bottom: 10px;">{icon}</div>' if icon else ""
+    subtitle_html = f'<div style="color: #6c757d; font-size: 0.9em;">{subtitle}</div>' if subtitle else ""
+    change_html = f"{change_open}{change}</div>" if change else ""
+    
+    return _METRIC_CARD_TMPL.substitute(
+        icon_html=icon_html,
+        title=title,
+        value=value,
+        subtitle_html=subtitle_html,
+        change_html=change_html
+    )
 
 
 def create_metric_card(
@@ -580,7 +1366,7 @@ def create_metric_card(
     change: Optional[str] = None,
     change_type: str = "neutral",
     icon: Optional[str] = None
-) -> HTML:
+) -> LazyHTML:
     """
     Create a metric display card.
     
@@ -593,61 +1379,35 @@ def create_metric_card(
         icon: Optional icon/emoji
     
     Returns:
-        IPython HTML object with metric card
+        LazyHTML object with metric card
     """
-    change_colors = {
-        "positive": "#28a745",
-        "negative": "#dc3545",
-        "neutral": "#6c757d"
-    }
-    
-    change_color = change_colors.get(change_type, "#6c757d")
-    
-    icon_html = f'<div style="font-size: 2em; margin-bottom: 10px;">{icon}</div>' if icon else ""
-    subtitle_html = f'<div style="color: #6c757d; font-size: 0.9em;">{subtitle}</div>' if subtitle else ""
-    change_html = f'<div style="color: {change_color}; font-weight: bold; margin-top: 5px;">{change}</div>' if change else ""
-    
-    card_html = f'''
-    <div style="
-        border: 1px solid #dee2e6;
-        border-radius: 8px;
-        padding: 20px;
-        margin: 10px 0;
-        text-align: center;
-        background: white;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    ">
-        {icon_html}
-        <div style="font-size: 0.9em; color: #6c757d; margin-bottom: 5px;">{title}</div>
-        <div style="font-size: 2em; font-weight: bold; color: #212529;">{value}</div>
-        {subtitle_html}
-        {change_html}
-    </div>
-    '''
+    build = _cached(_build_metric_card_str, title, value, subtitle, change, change_type, icon)
     
-    return HTML(card_html)
+    return LazyHTML(lambda: build(title, value, subtitle, change, change_type, icon))
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def create_timeline(
-    events: List[Dict[str, str]],
-    title: str = "Timeline"
-) -> HTML:
-    """
-    Create a vertical timeline.
-    
-    Args:
-        events: List of dictionaries with 'date', 'title', and 'description' keys
-        title: Timeline title
-    
-    Returns:
-        IPython HTML object with timeline
-    """
-    timeline_items = []
-    
-    for event in events:
-        timeline_items.append(f'''
+_render_timeline = _compile_renderer(
+    "_render_timeline",
+    "events, title",
+    '''
+    <div style="margin: 20px 0;">
+        <h4>{title!s}</h4>
+        <div style="margin-top: 20px;">
+            {items}
+        </div>
+    </div>
+    ''',
+    {
+        "items": (
+            "for event in events:",
+            [
+                "date = event.get('date', '')",
+                "event_title = event.get('title', '')",
+                "description = event.get('description', '')",
+            ],
+            '''
         <div style="
             position: relative;
             padding-left: 30px;
@@ -664,49 +1424,41 @@ def create_timeline(
                 background: #007bff;
             "></div>
             <div style="font-weight: bold; color: #007bff; font-size: 0.9em;">
-                {event.get('date', '')}
+                {date!s}
             </div>
             <div style="font-weight: bold; margin: 5px 0;">
-                {event.get('title', '')}
+                {event_title!s}
             </div>
             <div style="color: #6c757d;">
-                {event.get('description', '')}
+                {description!s}
             </div>
         </div>
-        ''')
-    
-    timeline_html = f'''
-    <div style="margin: 20px 0;">
-        <h4>{title}</h4>
-        <div style="margin-top: 20px;">
-            {"".join(timeline_items)}
-        </div>
-    </div>
-    '''
-    
-    return HTML(timeline_html)
+        '''
+        ),
+    }
+)
 
 
-def create_quote_block(
-    quote: str,
-    author: Optional[str] = None,
-    source: Optional[str] = None
-) -> HTML:
+def create_timeline(
+    events: List[Dict[str, str]],
+    title: str = "Timeline"
+) -> LazyHTML:
     """
-    Create a styled quote block.
+    Create a vertical timeline.
     
     Args:
-        quote: Quote text
-        author: Quote author (optional)
-        source: Quote source (optional)
+        events: List of dictionaries with 'date', 'title', and 'description' keys
+        title: Timeline title
     
     Returns:
-        IPython HTML object with quote block
+        LazyHTML object with timeline
     """
-    author_html = f"<cite>— {author}</cite>" if author else ""
-    source_html = f"<small>, {source}</small>" if source else ""
+    event_items = [dict(event) for event in events]
     
-    quote_html = f'''
+    return LazyHTML(lambda: _render_timeline(event_items, title))
+
+
+_QUOTE_TMPL = '''
     <blockquote style="
         border-left: 4px solid #007bff;
         padding: 20px;
@@ -715,14 +1467,98 @@ def create_quote_block(
         font-style: italic;
         font-size: 1.1em;
     ">
-        <p style="margin-bottom: 10px;">"{quote}"</p>
+        <div style="margin-bottom: 10px;">%s</div>
         <footer style="text-align: right; font-size: 0.9em;">
-            {author_html}{source_html}
+            %s%s
         </footer>
     </blockquote>
     '''
+
+
+# Openings of the block-level markup Markdown (or a composed component) can produce
+_BLOCK_TAGS = ("<p", "<ul", "<ol", "<dl", "<div", "<h", "<blockquote", "<table", "<hr")
+
+
+def _quote_text(quote: str) -> str:
+    """
+    Render ``quote`` as Markdown and add its quote marks.
+    
+    Inline text is wrapped in the marks. For block-level output they go
+    inside the first and last paragraph, or are dropped for other blocks,
+    so they never sit on lines of their own.
+    """
+    text = str(_md(quote))
+    if not text.lstrip().startswith(_BLOCK_TAGS):
+        return f'"{text}"'
+    if text.startswith("<p") and text.endswith("</p>"):
+        opening, _, body = text.partition(">")
+        return f'{opening}>"{body[:-4]}"</p>'
+    return text
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_quote_str(
+    quote: str,
+    author: Optional[str],
+    source: Optional[str]
+) -> str:
+    author_html = f"<cite>— {_esc(author)}</cite>" if author else ""
+    source_html = f"<small>, {source}</small>" if source else ""
+    
+    return _QUOTE_TMPL % (quote, author_html, source_html)
+
+
+def create_quote_block(
+    quote: str,
+    author: Optional[str] = None,
+    source: Optional[str] = None
+) -> LazyHTML:
+    """
+    Create a styled quote block.
+    
+    Args:
+        quote: Quote text (supports markdown)
+        author: Quote author (optional, HTML-escaped)
+        source: Quote source (optional)
+    
+    Returns:
+        LazyHTML object with quote block
+    """
+    build = _cached(_build_quote_str, quote, author, source)
+    
+    return LazyHTML(lambda: build(_quote_text(quote), author, source))
+
+
+_BUTTON_SIZE_CLASS = {"sm": "btn-sm", "md": "", "lg": "btn-lg"}
+
+_BUTTON_TMPL = Template('''
+    <a href="$url" class="btn btn-$style $size_class" $target 
+       style="margin: 10px 5px; text-decoration: none;">
+        $text
+    </a>
+    ''')
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_button_str(
+    text: str,
+    url: str,
+    style: str,
+    size: str,
+    new_tab: bool
+) -> str:
+    size_class = _BUTTON_SIZE_CLASS.get(size)
+    if size_class is None:
+        size_class = f"btn-{size}"
+    target = 'target="_blank" rel="noopener noreferrer"' if new_tab else ""
     
-    return HTML(quote_html)
+    return _BUTTON_TMPL.substitute(
+        url=_esc(url),
+        style=style,
+        size_class=size_class,
+        target=target,
+        text=_esc(text)
+    )
 
 
 def create_button_link(
@@ -731,31 +1567,47 @@ def create_button_link(
     style: str = "primary",
     size: str = "md",
     new_tab: bool = True
-) -> HTML:
+) -> LazyHTML:
     """
     Create a styled button link.
     
     Args:
-        text: Button text
-        url: Link URL
+        text: Button text (HTML-escaped)
+        url: Link URL (HTML-escaped)
         style: Bootstrap button style - "primary", "secondary", "success", etc. (default: "primary")
         size: Button size - "sm", "md", "lg" (default: "md")
         new_tab: Open in new tab (default: True)
     
     Returns:
-        IPython HTML object with button link
+        LazyHTML object with button link
     """
-    size_class = f"btn-{size}" if size != "md" else ""
-    target = 'target="_blank" rel="noopener noreferrer"' if new_tab else ""
+    build = _cached(_build_button_str, text, url, style, size, new_tab)
     
-    button_html = f'''
-    <a href="{url}" class="btn btn-{style} {size_class}" {target} 
-       style="margin: 10px 5px; text-decoration: none;">
-        {text}
-    </a>
-    '''
+    return LazyHTML(lambda: build(text, url, style, size, new_tab))
+
+
+_CODE_BLOCK_TMPL = Template('''
+    <div style="border: 1px solid #ddd; border-radius: 4px; margin: 15px 0; overflow: hidden;">
+        $title_html
+        <pre style="margin: 0; padding: 15px; background: #f8f9fa; overflow-x: auto;"><code class="language-$language">$code</code></pre>
+    </div>
+    ''')
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_code_block_str(
+    code: str,
+    language: str,
+    title: Optional[str],
+    line_numbers: bool
+) -> str:
+    title_html = f'<div style="background: #f1f3f4; padding: 8px 12px; font-weight: bold; border-bottom: 1px solid #ddd;">{title}</div>' if title else ""
     
-    return HTML(button_html)
+    return _CODE_BLOCK_TMPL.substitute(
+        title_html=title_html,
+        language=language,
+        code=code
+    )
 
 
 def create_code_block(
@@ -763,7 +1615,7 @@ def create_code_block(
     language: str = "python",
     title: Optional[str] = None,
     line_numbers: bool = False
-) -> HTML:
+) -> LazyHTML:
     """
     Create a syntax-highlighted code block.
     
@@ -774,18 +1626,23 @@ def create_code_block(
         line_numbers: Show line numbers (default: False)
     
     Returns:
-        IPython HTML object with code block
+        LazyHTML object with code block
     """
-    title_html = f'<div style="background: #f1f3f4; padding: 8px 12px; font-weight: bold; border-bottom: 1px solid #ddd;">{title}</div>' if title else ""
+    build = _cached(_build_code_block_str, code, language, title, line_numbers)
     
-    code_html = f'''
-    <div style="border: 1px solid #ddd; border-radius: 4px; margin: 15px 0; overflow: hidden;">
-        {title_html}
-        <pre style="margin: 0; padding: 15px; background: #f8f9fa; overflow-x: auto;"><code class="language-{language}">{code}</code></pre>
+    return LazyHTML(lambda: build(code, language, title, line_numbers))
+
+
+_TWO_COLUMN_TMPL = Template('''
+    <div class="row" style="margin: 20px 0;">
+        <div class="col-md-$left_width">
+            $left_content
+        </div>
+        <div class="col-md-$right_width">
+            $right_content
+        </div>
     </div>
-    '''
-    
-    return HTML(code_html)
+    ''')
 
 
 def create_two_column_layout(
@@ -793,7 +1650,7 @@ def create_two_column_layout(
     right_content: str,
     left_width: int = 6,
     right_width: int = 6
-) -> HTML:
+) -> LazyHTML:
     """
     Create a two-column layout using Bootstrap grid.
     
@@ -804,100 +1661,200 @@ def create_two_column_layout(
         right_width: Right column width (1-12, default: 6)
     
     Returns:
-        IPython HTML object with two-column layout
+        LazyHTML object with two-column layout
     """
-    layout_html = f'''
-    <div class="row" style="margin: 20px 0;">
-        <div class="col-md-{left_width}">
-            {left_content}
+    return LazyHTML(lambda: _TWO_COLUMN_TMPL.substitute(
+        left_width=left_width,
+        left_content=left_content,
+        right_width=right_width,
+        right_content=right_content
+    ))
+
+
+_IMAGE_DEFAULTS = {"alt": "", "caption": ""}
+
+_IMAGE_CARD_TMPL = '''
+        <div class="col-md-{col_width} mb-4">
+            <div class="card">
+                <img src="{src}" class="card-img-top" alt="{alt}" style="height: 200px; object-fit: cover;">
+                <div class="card-body">
+                    <div class="text-center mt-2"><small>{caption}</small></div>
+                </div>
+            </div>
         </div>
-        <div class="col-md-{right_width}">
-            {right_content}
+        '''
+
+_IMAGE_GALLERY_TMPL = '''
+    <div style="margin: 20px 0;">
+        {title_html}
+        <div class="row">
+            {items}
         </div>
     </div>
     '''
+
+
+@lru_cache(maxsize=512, typed=True)
+def _build_image_gallery_str(
+    images: Tuple[Tuple[Tuple[str, str], ...], ...],
+    columns: int,
+    title: Optional[str]
+) -> str:
+    layout = {"col_width": 12 // columns}
+    title_html = f"<h4>{title}</h4>" if title else ""
+    
+    # Missing alt/caption keys fall through to the empty defaults
+    items = "".join(
+        _IMAGE_CARD_TMPL.format_map(ChainMap(
+            layout,
+            {key: _esc(value) for key, value in img_items if value is not None},
+            _IMAGE_DEFAULTS
+        ))
+        for img_items in images
+    )
     
-    return HTML(layout_html)
+    return _IMAGE_GALLERY_TMPL.format(title_html=title_html, items=items)
 
 
 def create_image_gallery(
     images: List[Dict[str, str]],
     columns: int = 3,
     title: Optional[str] = None
-) -> HTML:
+) -> LazyHTML:
     """
     Create an image gallery.
     
     Args:
-        images: List of dicts with 'src', 'alt', and optional 'caption' keys
-        columns: Number of columns (default: 3)
+        images: List of dicts with 'src', 'alt', and optional 'caption' keys (HTML-escaped);
+            'src' is required
+        columns: Number of columns, must be positive (default: 3)
         title: Optional gallery title
     
     Returns:
-        IPython HTML object with image gallery
+        LazyHTML object with image gallery
     """
-    col_width = 12 // columns
-    title_html = f"<h4>{title}</h4>" if title else ""
+    if columns <= 0:
+        raise ValueError("columns must be positive")
+    image_items = tuple(tuple(img.items()) for img in images)
+    if any("src" not in img for img in images):
+        raise KeyError("src")
     
-    image_items = []
-    for img in images:
-        caption_html = f'<div class="text-center mt-2"><small>{img.get("caption", "")}</small></div>' if img.get("caption") else ""
-        
-        image_items.append(f'''
-        <div class="col-md-{col_width} mb-4">
-            <div class="card">
-                <img src="{img['src']}" class="card-img-top" alt="{img.get('alt', '')}" style="height: 200px; object-fit: cover;">
-                <div class="card-body">
-                    {caption_html}
-                </div>
-            </div>
-        </div>
-        ''')
-    
-    gallery_html = f'''
-    <div style="margin: 20px 0;">
-        {title_html}
-        <div class="row">
-            {"".join(image_items)}
-        </div>
-    </div>
-    '''
+    build = _cached(_build_image_gallery_str, image_items, columns, title)
     
-    return HTML(gallery_html)
+    return LazyHTML(lambda: build(image_items, columns, title))
 
 
 # =============================================================================
 # QUICK HELPERS
 # =============================================================================
 
-def quick_note(content: str) -> HTML:
+# The quick helpers always call their builder with the same fixed arguments,
+# so each one is rendered once around _SLOT placeholders at import and turned
+# into a %-format string; a call then only has to substitute its own arguments.
+_SLOT = "\x00"
+
+
+def _fixed_template(markup: str) -> str:
+    return "%s".join(part.replace("%", "%%") for part in markup.split(_SLOT))
+
+
+_NOTE_TMPL = _fixed_template(_build_callout_str.__wrapped__(_SLOT, "note", None, False, False))
+_TIP_TMPL = _fixed_template(_build_callout_str.__wrapped__(_SLOT, "tip", None, False, False))
+_WARNING_TMPL = _fixed_template(_build_callout_str.__wrapped__(_SLOT, "warning", None, False, False))
+_SUCCESS_TMPL = _fixed_template(_build_alert_str.__wrapped__(_SLOT, "success", None, False))
+_INFO_TMPL = _fixed_template(_build_alert_str.__wrapped__(_SLOT, "info", None, False))
+_YOUTUBE_TMPL = _fixed_template(_build_youtube_str.__wrapped__(_SLOT, "100%", 0.5625, None, False, True))
+_QUICK_IFRAME_TMPL = _fixed_template(_build_iframe_str.__wrapped__(_SLOT, 0.5625, "100%", "0", True, "lazy"))
+_QUICK_QUOTE_TMPL = _fixed_template(_build_quote_str.__wrapped__(_SLOT, None, None))
+_QUICK_QUOTE_AUTHOR_TMPL = _fixed_template(_build_quote_str.__wrapped__(_SLOT, _SLOT, None))
+
+
+def quick_note(content: str) -> LazyHTML:
     """Quick note callout."""
-    return create_callout(content, "note")
+    return LazyHTML(lambda: _NOTE_TMPL % (_md(content),))
 
-def quick_tip(content: str) -> HTML:
+def quick_tip(content: str) -> LazyHTML:
     """Quick tip callout."""
-    return create_callout(content, "tip")
+    return LazyHTML(lambda: _TIP_TMPL % (_md(content),))
 
-def quick_warning(content: str) -> HTML:
+def quick_warning(content: str) -> LazyHTML:
     """Quick warning callout."""
-    return create_callout(content, "warning")
+    return LazyHTML(lambda: _WARNING_TMPL % (_md(content),))
 
-def quick_success(content: str) -> HTML:
+def quick_success(content: str) -> LazyHTML:
     """Quick success alert."""
-    return create_alert_box(content, "success")
+    return LazyHTML(lambda: _SUCCESS_TMPL % (_md(content),))
 
-def quick_info(content: str) -> HTML:
+def quick_info(content: str) -> LazyHTML:
     """Quick info alert."""
-    return create_alert_box(content, "info")
+    return LazyHTML(lambda: _INFO_TMPL % (_md(content),))
 
-def quick_youtube(video_id: str) -> HTML:
+def quick_youtube(video_id: str) -> LazyHTML:
     """Quick YouTube embed with standard settings."""
-    return embed_youtube(video_id)
+    return LazyHTML(lambda: _YOUTUBE_TMPL % (_esc(video_id),))
 
-def quick_iframe(url: str, aspect_ratio: float = 0.5625) -> HTML:
+def quick_iframe(url: str, aspect_ratio: float = 0.5625) -> LazyHTML:
     """Quick responsive iframe."""
-    return create_responsive_iframe(url, aspect_ratio)
+    if aspect_ratio != 0.5625:
+        return create_responsive_iframe(url, aspect_ratio)
+    return LazyHTML(lambda: _QUICK_IFRAME_TMPL % (url,))
 
-def quick_quote(quote: str, author: Optional[str] = None) -> HTML:
+def quick_quote(quote: str, author: Optional[str] = None) -> LazyHTML:
     """Quick quote block."""
-    return create_quote_block(quote, author)
\ No newline at end of file
+    if author:
+        return LazyHTML(lambda: _QUICK_QUOTE_AUTHOR_TMPL % (_quote_text(quote), _esc(author)))
+    return LazyHTML(lambda: _QUICK_QUOTE_TMPL % (_quote_text(quote),))
+
+
+# =============================================================================
+# BATCH RENDERING
+# =============================================================================
+
+_DISPATCH: Dict[str, Callable[..., LazyHTML]] = {
+    "callout": create_callout,
+    "alert": create_alert_box,
+    "info_box": create_info_box,
+    "iframe": create_responsive_iframe,
+    "youtube": embed_youtube,
+    "vimeo": embed_vimeo,
+    "tweet": embed_twitter_tweet,
+    "codepen": embed_codepen,
+    "plotly": embed_plotly_chart,
+    "styled_table": create_styled_table,
+    "summary_stats": create_summary_stats,
+    "comparison_table": create_comparison_table,
+    "tabs": create_tabs,
+    "accordion": create_accordion,
+    "progress_bar": create_progress_bar,
+    "metric_card": create_metric_card,
+    "timeline": create_timeline,
+    "quote": create_quote_block,
+    "button": create_button_link,
+    "code_block": create_code_block,
+    "two_column": create_two_column_layout,
+    "image_gallery": create_image_gallery,
+}
+
+
+def render_many(specs: Iterable[Tuple[str, Dict[str, object]]]) -> LazyHTML:
+    """
+    Render several components as a single HTML display object.
+    
+    Args:
+        specs: Sequence of (kind, kwargs) pairs, e.g. ("callout", {"content": "Hi"});
+            kind is one of "callout", "alert", "info_box", "iframe", "youtube",
+            "vimeo", "tweet", "codepen", "plotly", "styled_table", "summary_stats",
+            "comparison_table", "tabs", "accordion", "progress_bar", "metric_card",
+            "timeline", "quote", "button", "code_block", "two_column", "image_gallery"
+    
+    Returns:
+        LazyHTML object with the concatenated components
+    """
+    parts = []
+    for kind, kwargs in specs:
+        builder = _DISPATCH.get(kind)
+        if builder is None:
+            raise ValueError(f"Unknown component kind: {kind!r}")
+        parts.append(builder(**kwargs))
+    
+    return LazyHTML(lambda: "".join(map(str, parts)))
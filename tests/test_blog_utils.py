@@ -0,0 +1,251 @@
+"""
+Parity tests for the fast HTML paths in ``posts/blog_utils.py``.
+
+The table builders write markup directly from NumPy arrays instead of going
+through pandas; these tests pin that output to what pandas itself renders.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "posts"))
+
+import blog_utils  # noqa: E402
+
+
+TABLE_CLASS = "table table-striped table-hover"
+
+
+def _styled_table_via_pandas(df: pd.DataFrame) -> str:
+    table_html = df.to_html(classes=TABLE_CLASS, escape=False, table_id="styled-table")
+    return blog_utils._wrap_styled_table(table_html, None, None, True)
+
+
+@pytest.mark.parametrize("dtype, values", [
+    ("int64", [1, 2, 3]),
+    ("float64", [1.5, np.nan, 3.25]),
+    ("float64", [0.1, 2.0, 30.0]),
+    ("Int64", [1, None, 3]),
+    ("Float64", [1.5, None, 3.0]),
+    ("UInt8", [1, 2, None]),
+])
+def test_styled_table_matches_to_html(dtype, values):
+    df = pd.DataFrame({"a": pd.array(values, dtype=dtype), "b": np.arange(3.0)})
+
+    assert str(blog_utils.create_styled_table(df)) == _styled_table_via_pandas(df)
+
+
+def test_builders_snapshot_mutable_inputs():
+    events = [{"date": "2024-01", "title": "Start"}]
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    data = {"A": [1, 5, 3]}
+    timeline = blog_utils.create_timeline(events)
+    table = blog_utils.create_styled_table(df)
+    stats = blog_utils.create_summary_stats(df)
+    comparison = blog_utils.create_comparison_table(data)
+    expected = [str(blog_utils.create_timeline(events)), str(blog_utils.create_styled_table(df)),
+                str(blog_utils.create_summary_stats(df)), str(blog_utils.create_comparison_table(data))]
+
+    events[0]["title"] = "Changed"
+    events.append({"title": "Later"})
+    df.loc[0, "a"] = 100
+    data["A"].append(9)
+
+    assert [str(timeline), str(table), str(stats), str(comparison)] == expected
+
+
+@pytest.mark.parametrize("build, error", [
+    (lambda: blog_utils.create_progress_bar(5, 0), ValueError),
+    (lambda: blog_utils.create_progress_bar("5"), TypeError),
+    (lambda: blog_utils.create_responsive_iframe("https://example.com", aspect_ratio="wide"), TypeError),
+    (lambda: blog_utils.create_summary_stats(pd.DataFrame({"a": [1.0]}), columns=["missing"]), KeyError),
+    (lambda: blog_utils.create_summary_stats(pd.DataFrame({"a": ["x"]})), ValueError),
+    (lambda: blog_utils.create_image_gallery([{"alt": "x"}]), KeyError),
+    (lambda: blog_utils.create_image_gallery([{"src": "a.jpg"}], columns=0), ValueError),
+    (lambda: blog_utils.create_comparison_table({"a": [1, 2], "b": [1]}), ValueError),
+    (lambda: blog_utils.create_comparison_table({"a": [1, 2], "b": [1]}, highlight_best=False), ValueError),
+])
+def test_invalid_arguments_raise_at_call_time(build, error):
+    with pytest.raises(error):
+        build()
+
+
+@pytest.mark.parametrize("build", [
+    lambda: blog_utils.create_tabs({"Data": [1, 2]}),
+    lambda: blog_utils.create_accordion({"Data": [1, 2]}),
+    lambda: blog_utils.create_callout([1, 2]),
+    lambda: blog_utils.create_metric_card("Users", [1, 2]),
+])
+def test_unhashable_arguments_render_uncached(build):
+    assert "[1, 2]" in str(build())
+
+
+def _summary_stats_via_describe(numeric: pd.DataFrame) -> str:
+    table_html = numeric.describe().round(3).to_html(classes=TABLE_CLASS, escape=False, table_id="styled-table")
+    return blog_utils._wrap_styled_table(table_html, "Summary Statistics", None, True)
+
+
+@pytest.mark.parametrize("scale, dtype", [
+    (1.0, "float64"),
+    (1000.0, "int64"),
+    (5e6, "float64"),
+    (1e-5, "float64"),
+    (1.0, "Float64"),
+])
+def test_summary_stats_match_describe(scale, dtype):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(10, 3, (200, 3)) * scale, columns=["a", "b", "c"]).astype(dtype)
+    if dtype == "float64":
+        df.iloc[::7, 1] = np.nan
+
+    assert str(blog_utils.create_summary_stats(df)) == _summary_stats_via_describe(df)
+
+
+def test_summary_stats_with_count_above_a_million():
+    df = pd.DataFrame({"a": np.arange(1_000_001, dtype=np.float64) % 97})
+
+    assert str(blog_utils.create_summary_stats(df)) == _summary_stats_via_describe(df)
+
+
+@pytest.mark.parametrize("data", [
+    {"A": [1, 5, 3], "B": [4.5, 2.0, 1.0]},
+    {"<i>x</i>": [1.0, 2.0], 'a & "b"': [3, 4]},
+])
+def test_unhighlighted_comparison_table_matches_to_html(data):
+    expected = pd.DataFrame(data).to_html(classes=TABLE_CLASS)
+
+    assert expected in str(blog_utils.create_comparison_table(data, highlight_best=False))
+
+
+def test_markdown_leaves_html_content_alone():
+    pytest.importorskip("markdown")
+    card = str(blog_utils.create_metric_card("Users", "1.2K"))
+
+    assert card in str(blog_utils.create_callout(card))
+    assert card in str(blog_utils.quick_note(blog_utils.create_metric_card("Users", "1.2K")))
+
+
+def test_markdown_renders_indented_content():
+    pytest.importorskip("markdown")
+    content = """
+        Some **bold** text
+
+        - one
+        - two
+    """
+
+    html = str(blog_utils.create_alert_box(content))
+
+    assert "<strong>bold</strong>" in html
+    assert "<li>one</li>" in html
+    assert "<code>" not in html
+
+
+@pytest.mark.parametrize("quote, expected", [
+    ("To be\n\nor not", '<p>"To be</p>\n<p>or not"</p>'),
+    ("- one\n- two", "<ul>\n<li>one</li>\n<li>two</li>\n</ul>"),
+    ("**Bold** claim", '"<strong>Bold</strong> claim"'),
+])
+def test_quote_marks_stay_inside_block_markdown(quote, expected):
+    pytest.importorskip("markdown")
+    wrapper = '<div style="margin-bottom: 10px;">%s</div>'
+
+    assert wrapper % expected in str(blog_utils.create_quote_block(quote))
+    assert wrapper % expected in str(blog_utils.quick_quote(quote))
+
+
+def test_plain_quote_is_wrapped_in_quote_marks():
+    html = str(blog_utils.create_quote_block("Plain words", author="A"))
+
+    assert '<div style="margin-bottom: 10px;">"Plain words"</div>' in html
+
+
+@pytest.mark.parametrize("border", [0, 1, 2])
+def test_styled_table_follows_html_border_option(border):
+    df = pd.DataFrame({"a": [1.5, 2.0]})
+
+    with pd.option_context("display.html.border", border):
+        assert str(blog_utils.create_styled_table(df)) == _styled_table_via_pandas(df)
+
+
+@pytest.mark.parametrize("index", [
+    ["x", np.nan],
+    ["x", None],
+    ["x", 1.5],
+    ["x", True],
+])
+def test_styled_table_object_index_matches_to_html(index):
+    df = pd.DataFrame({"a": [1.0, 2.5]}, index=pd.Index(index, dtype=object))
+
+    assert str(blog_utils.create_styled_table(df)) == _styled_table_via_pandas(df)
+
+
+RAW = 'a&b<c"d'
+ESCAPED = "a&amp;b&lt;c&quot;d"
+
+
+@pytest.mark.parametrize("build", [
+    lambda: blog_utils.embed_youtube(RAW),
+    lambda: blog_utils.quick_youtube(RAW),
+    lambda: blog_utils.embed_vimeo(RAW),
+    lambda: blog_utils.create_button_link(RAW, "https://example.com"),
+    lambda: blog_utils.create_button_link("Visit", RAW),
+    lambda: blog_utils.create_image_gallery([{"src": RAW}]),
+    lambda: blog_utils.create_image_gallery([{"src": "a.jpg", "alt": RAW}]),
+    lambda: blog_utils.create_image_gallery([{"src": "a.jpg", "caption": RAW}]),
+    lambda: blog_utils.create_quote_block("Quote", author=RAW),
+    lambda: blog_utils.quick_quote("Quote", RAW),
+], ids=[
+    "youtube-id", "quick-youtube-id", "vimeo-id", "button-text", "button-url",
+    "gallery-src", "gallery-alt", "gallery-caption", "quote-author", "quick-quote-author",
+])
+def test_user_supplied_fields_are_escaped(build):
+    html = str(build())
+
+    assert ESCAPED in html
+    assert RAW not in html
+
+
+@pytest.mark.parametrize("values", [[1, "a"], [90, 85, "n/a"]])
+def test_mixed_type_comparison_column_is_not_compared_as_text(values):
+    with pytest.raises(TypeError):
+        blog_utils.create_comparison_table({"score": values})
+
+    html = str(blog_utils.create_comparison_table({"score": values}, highlight_best=False))
+    assert pd.DataFrame({"score": values}).to_html(classes=TABLE_CLASS) in html
+
+
+def test_string_comparison_column_highlights_the_maximum():
+    html = str(blog_utils.create_comparison_table({"grade": ["B", "A", "C"]}))
+
+    assert '<td style="background-color: lightgreen;">C</td>' in html
+    assert html.count("lightgreen") == 1
+
+
+def test_render_many_concatenates_in_order():
+    html = str(blog_utils.render_many([
+        ("callout", {"content": "First", "callout_type": "important"}),
+        ("metric_card", {"title": "Revenue", "value": "$125K"}),
+        ("progress_bar", {"value": 75, "color": "success"}),
+    ]))
+
+    assert html == "".join([
+        str(blog_utils.create_callout("First", callout_type="important")),
+        str(blog_utils.create_metric_card("Revenue", "$125K")),
+        str(blog_utils.create_progress_bar(75, color="success")),
+    ])
+    assert html.index("First") < html.index("Revenue") < html.index("progress-bar")
+
+
+def test_render_many_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unknown component kind: 'chart'"):
+        blog_utils.render_many([("callout", {"content": "ok"}), ("chart", {})])
+
+
+def test_render_many_validates_at_call_time():
+    with pytest.raises(ValueError):
+        blog_utils.render_many([("progress_bar", {"value": 5, "max_value": 0})])